@@ -11,12 +11,23 @@ except ImportError:
     ask_gemma = None
 
 try:
-    from utils.groq_client import groq_client
-except (ImportError, ValueError):
-    groq_client = None
+    from utils.groq_client import get_groq_client
+except ImportError:
+    get_groq_client = None
 
 logger = logging.getLogger(__name__)
 
+
+def _get_groq_client():
+    """Get the shared GROQ client, or None when GROQ is unavailable (e.g. no API key in test environments)"""
+    if get_groq_client is None:
+        return None
+    try:
+        return get_groq_client()
+    except (ImportError, ValueError):
+        return None
+
+
 class BaseCoScientistAgent(Agent):
     """Base class for AI Co-Scientist agents using Google ADK with multi-model support"""
     
@@ -72,6 +83,7 @@ class BaseCoScientistAgent(Agent):
                 
             elif self._actual_model.startswith(("llama-", "gemma2-", "qwen/")):
                 # Use GROQ models
+                groq_client = _get_groq_client()
                 if groq_client is None:
                     return f"[TEST MODE] Would use GROQ {self._actual_model} for: {prompt[:50]}..."
                 
@@ -92,6 +104,7 @@ class BaseCoScientistAgent(Agent):
             logger.error(f"Error generating response in {self.name}: {e}")
             # Fallback to GROQ Llama as backup
             try:
+                groq_client = _get_groq_client()
                 if groq_client is None:
                     return f"[TEST MODE] Fallback would use GROQ Llama for: {prompt[:50]}..."
                 
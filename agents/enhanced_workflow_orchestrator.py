@@ -18,7 +18,7 @@ from utils.models import (
     ProcessingStep,
     AgentOutput,
 )
-from utils.memory_service import enhanced_memory_service
+from utils.memory_service import get_enhanced_memory_service
 
 class EnhancedAICoScientistWorkflow:
     """
@@ -28,7 +28,7 @@ class EnhancedAICoScientistWorkflow:
     
     def __init__(self, memory_service=None):
         # Initialize enhanced memory service
-        self.memory_service = memory_service or enhanced_memory_service
+        self.memory_service = memory_service or get_enhanced_memory_service()
         
         # Initialize smart orchestrator for model assignment
         self.smart_orchestrator = SmartOrchestrator()
@@ -126,6 +126,7 @@ class EnhancedAICoScientistWorkflow:
         critiques_data = reflection_step.agent_outputs[0].metadata.get("critiques", [])
         
         # Store evaluations in memory
+        evaluations = []
         for critique in critiques_data:
             hypothesis_id = critique.get("hypothesis_id")
             if hypothesis_id:
@@ -142,7 +143,8 @@ class EnhancedAICoScientistWorkflow:
                     "processing_time": reflection_step.duration_seconds,
                     "confidence": critique.get("confidence", 0.0)
                 }
-                self.memory_service.store_evaluation(hypothesis_id, evaluation_data, "reflection_agent")
+                evaluations.append((hypothesis_id, evaluation_data))
+        self.memory_service.store_evaluations(evaluations, "reflection_agent")
         
         # Step 4: Hypothesis Ranking
         step_recommendation = workflow_analysis["step_recommendations"][3]["recommendation"]
@@ -12,6 +12,13 @@ try:
 except ImportError:
     from test_prompts import MockAgentPrompts as AgentPrompts, MockPromptTemplates as PromptTemplates
 
+# Vocabulary for _extract_key_concepts, in priority order
+_SCIENTIFIC_KEYWORDS = (
+    "machine learning", "artificial intelligence", "quantum", "biomarker",
+    "genetic", "protein", "algorithm", "neural network", "optimization",
+    "modeling", "simulation", "experimental", "computational", "analysis"
+)
+
 class ProximityAgent(BaseCoScientistAgent):
     """Agent responsible for retrieving related knowledge and grounding hypotheses using GROQ Llama scout"""
     
@@ -165,18 +172,8 @@ class ProximityAgent(BaseCoScientistAgent):
     def _extract_key_concepts(self, text: str) -> List[str]:
         """Extract key scientific concepts from text (simple implementation)"""
         # Simple keyword extraction - in production, use NLP libraries
-        scientific_keywords = [
-            "machine learning", "artificial intelligence", "quantum", "biomarker", 
-            "genetic", "protein", "algorithm", "neural network", "optimization",
-            "modeling", "simulation", "experimental", "computational", "analysis"
-        ]
-        
         text_lower = text.lower()
-        found_concepts = []
-        
-        for keyword in scientific_keywords:
-            if keyword in text_lower:
-                found_concepts.append(keyword)
+        found_concepts = [keyword for keyword in _SCIENTIFIC_KEYWORDS if keyword in text_lower]
         
         # Add basic concepts from text (simple word extraction)
         words = text.split()
@@ -8,6 +8,12 @@ from utils.config import MODEL_STRENGTHS, ANTHROPIC_API_KEY
 
 logger = logging.getLogger(__name__)
 
+# MODEL_STRENGTHS is read-only, so its prompt listing is formatted once at import
+_MODEL_STRENGTHS_TEXT = "\n".join(
+    f"- {model_id}: {info['model']} - {info['strengths']}"
+    for model_id, info in MODEL_STRENGTHS.items()
+)
+
 class SmartOrchestrator(BaseCoScientistAgent):
     """
     Intelligent orchestrator using Claude Opus 4 to analyze tasks and assign 
@@ -25,15 +31,10 @@ class SmartOrchestrator(BaseCoScientistAgent):
     
     def get_system_prompt(self) -> str:
         """System prompt for the orchestrator agent"""
-        strengths_text = "\n".join([
-            f"- {model_id}: {info['model']} - {info['strengths']}"
-            for model_id, info in self.model_strengths.items()
-        ])
-        
         return f"""You are an intelligent orchestrator for a scientific AI system. Your role is to analyze tasks and assign the most suitable AI model based on task requirements and model strengths.
 
 Available Models and Their Strengths:
-{strengths_text}
+{_MODEL_STRENGTHS_TEXT}
 
 Your responsibilities:
 1. Analyze incoming scientific tasks and their requirements
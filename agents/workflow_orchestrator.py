@@ -17,14 +17,14 @@ from utils.models import (
     ProcessingStep,
     AgentOutput,
 )
-from utils.memory_service import enhanced_memory_service
+from utils.memory_service import get_enhanced_memory_service
 
 class AICoScientistWorkflow:
     """ADK-based workflow orchestrator for the AI Co-Scientist system"""
     
     def __init__(self, memory_service=None):
         # Initialize enhanced memory service
-        self.memory_service = memory_service or enhanced_memory_service
+        self.memory_service = memory_service or get_enhanced_memory_service()
         
         # Initialize all agents
         self.generation_agent = GenerationAgent()
@@ -92,6 +92,7 @@ class AICoScientistWorkflow:
         critiques_data = reflection_step.agent_outputs[0].metadata.get("critiques", [])
         
         # Store evaluations in memory
+        evaluations = []
         for critique in critiques_data:
             hypothesis_id = critique.get("hypothesis_id")
             if hypothesis_id:
@@ -108,7 +109,8 @@ class AICoScientistWorkflow:
                     "processing_time": reflection_step.duration_seconds,
                     "confidence": critique.get("confidence", 0.0)
                 }
-                self.memory_service.store_evaluation(hypothesis_id, evaluation_data, "reflection_agent")
+                evaluations.append((hypothesis_id, evaluation_data))
+        self.memory_service.store_evaluations(evaluations, "reflection_agent")
         
         # Step 4: Hypothesis Ranking
         ranking_step = self._run_ranking_step(hypotheses_data, critiques_data)
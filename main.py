@@ -1,8 +1,8 @@
 import os
 import logging
-import json
 from datetime import datetime
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Security, Depends, HTTPException as FastAPIHTTPException
 from fastapi.responses import FileResponse, HTMLResponse
@@ -30,12 +30,9 @@ from utils.terminal_colors import (
 )
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Without an API key every request would be rejected with 401, so refuse to start
+if not API_KEY:
+    raise ValueError("API_KEY not found in environment variables")
 
 # Setup logging
 logger = setup_logging()
@@ -57,9 +54,9 @@ def save_query_response(query: str, response_data: dict):
         data = []
         if os.path.exists(results_file) and os.path.getsize(results_file) > 0:
             try:
-                with open(results_file, 'r') as f:
-                    data = json.load(f)
-            except json.JSONDecodeError:
+                with open(results_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
                 # If file is corrupted or empty, start with empty list
                 logger.warning(f"Corrupted or empty JSON file {results_file}, starting fresh")
                 data = []
@@ -72,9 +69,9 @@ def save_query_response(query: str, response_data: dict):
         }
         data.append(entry)
         
-        # Save back to file
-        with open(results_file, 'w') as f:
-            json.dump(data, f, indent=2, cls=DateTimeEncoder)
+        # Save back to file (orjson serializes datetime objects natively)
+        with open(results_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
         logger.info(f"Saved query/response to {results_file}")
         print_success(f"Saved to JSON file: {results_file}")
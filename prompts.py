@@ -3,6 +3,9 @@ Centralized prompts for the AI Co-Scientist system.
 All system prompts and prompt templates are defined here.
 """
 
+from functools import lru_cache
+
+
 class AgentPrompts:
     """System prompts for different AI agents"""
     
@@ -637,6 +640,7 @@ class PromptTemplates:
     """Template prompts for common operations"""
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def hypothesis_generation_template(research_query: str, max_hypotheses: int = 5) -> str:
         """Template for hypothesis generation requests"""
         return f"""Research Query: {research_query}
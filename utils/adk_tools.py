@@ -3,12 +3,54 @@ ADK Tools for AI Co-Scientist agents
 Provides reusable tool functions that can be used across different agents
 """
 
-from typing import Dict, Any, List
-import json
+from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from operator import itemgetter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Static pieces of the mock knowledge items, built once at import
+_TITLE_TEMPLATE = "Research Paper {} on {}"
+_ABSTRACT_TEMPLATE = "Abstract discussing {} in the context of {}"
+_JOURNAL_TEMPLATE = "Journal of {}"
+_MOCK_AUTHORS = ("Author 1", "Author 2")
+
+# Static pieces of the mock evolution output
+_EVOLVED_TEMPLATE = "[Iteration {}] Evolved: {}"
+_EVOLUTION_IMPROVEMENTS = (
+    "Addressed feasibility concerns",
+    "Enhanced testability",
+    "Incorporated feedback"
+)
+
+# Static fields of the mock experimental plan; budgets are filled in per call
+_EXPERIMENT_TEMPLATES = (
+    {
+        "experiment_id": "exp_1",
+        "title": "Primary validation experiment for hypothesis",
+        "methodology": "Controlled laboratory study",
+        "duration": "4 weeks",
+        "equipment_needed": ("Standard lab equipment", "Specialized instruments"),
+        "expected_outcomes": (
+            "Validation or refutation of hypothesis",
+            "Quantitative measurements",
+            "Statistical significance"
+        ),
+        "success_criteria": "p < 0.05 with effect size > 0.5"
+    },
+    {
+        "experiment_id": "exp_2",
+        "title": "Follow-up replication study",
+        "methodology": "Independent replication",
+        "duration": "2 weeks",
+        "equipment_needed": ("Basic lab setup",),
+        "expected_outcomes": ("Reproducibility confirmation",),
+        "success_criteria": "Consistent results with primary study"
+    }
+)
+_EXPERIMENT_BUDGET_SHARES = (0.6, 0.3)
+
 
 def generate_hypotheses_tool(query: str, domain: str, num_hypotheses: int = 5) -> Dict[str, Any]:
     """
@@ -62,20 +104,17 @@ def critique_hypothesis_tool(hypothesis: str, criteria: List[str]) -> Dict[str,
         Dict containing critique results and scores
     """
     try:
-        critiques = {}
-        overall_score = 0
+        criterion_scores, overall_score = _score_hypothesis(hypothesis, tuple(criteria))
         
-        for criterion in criteria:
-            # Mock scoring logic - in real implementation would use domain knowledge
-            score = 0.75  # Placeholder score
-            critiques[criterion] = {
+        # Built fresh per call: only the immutable scores are shared through the cache
+        critiques = {
+            criterion: {
                 "score": score,
                 "feedback": f"Evaluation of {criterion} for the hypothesis",
                 "suggestions": [f"Suggestion for improving {criterion}"]
             }
-            overall_score += score
-        
-        overall_score = overall_score / len(criteria) if criteria else 0
+            for criterion, score in criterion_scores
+        }
         
         return {
             "status": "success",
@@ -92,6 +131,27 @@ def critique_hypothesis_tool(hypothesis: str, criteria: List[str]) -> Dict[str,
         }
 
 
+@lru_cache(maxsize=512)
+def _score_hypothesis(hypothesis: str, criteria: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, float], ...], float]:
+    """
+    Memoized scoring for an exact (hypothesis, criteria) pair.
+    Evolution rounds re-critique identical hypotheses, so repeats are served
+    from the cache. Returns ((criterion, score), ...) and the overall score.
+    """
+    criterion_scores = []
+    overall_score = 0
+    
+    for criterion in criteria:
+        # Mock scoring logic - in real implementation would use domain knowledge
+        score = 0.75  # Placeholder score
+        criterion_scores.append((criterion, score))
+        overall_score += score
+    
+    overall_score = overall_score / len(criteria) if criteria else 0
+    
+    return tuple(criterion_scores), overall_score
+
+
 def rank_hypotheses_tool(hypotheses: List[Dict], criteria: List[str]) -> Dict[str, Any]:
     """
     Tool for ranking multiple hypotheses based on given criteria
@@ -105,6 +165,7 @@ def rank_hypotheses_tool(hypotheses: List[Dict], criteria: List[str]) -> Dict[st
     """
     try:
         ranked_hypotheses = []
+        inv_criteria_count = 1.0 / len(criteria) if criteria else 0.0
         
         for i, hypothesis in enumerate(hypotheses):
             # Calculate composite score based on criteria
@@ -117,7 +178,7 @@ def rank_hypotheses_tool(hypotheses: List[Dict], criteria: List[str]) -> Dict[st
                 scores[criterion] = score
                 total_score += score
             
-            avg_score = total_score / len(criteria) if criteria else 0
+            avg_score = total_score * inv_criteria_count
             
             ranked_hypotheses.append({
                 "hypothesis": hypothesis,
@@ -127,11 +188,11 @@ def rank_hypotheses_tool(hypotheses: List[Dict], criteria: List[str]) -> Dict[st
             })
         
         # Sort by total score descending
-        ranked_hypotheses.sort(key=lambda x: x["total_score"], reverse=True)
+        ranked_hypotheses.sort(key=itemgetter("total_score"), reverse=True)
         
         # Update ranks
-        for i, item in enumerate(ranked_hypotheses):
-            item["rank"] = i + 1
+        for rank, item in enumerate(ranked_hypotheses, start=1):
+            item["rank"] = rank
         
         return {
             "status": "success",
@@ -164,7 +225,7 @@ def evolve_hypothesis_tool(hypothesis: Dict, feedback: str, iteration: int) -> D
         original_text = hypothesis.get("hypothesis", "")
         
         # Mock evolution logic - would use advanced reasoning
-        evolved_text = f"[Iteration {iteration}] Evolved: {original_text}"
+        evolved_text = _EVOLVED_TEMPLATE.format(iteration, original_text)
         
         return {
             "status": "success",
@@ -172,11 +233,7 @@ def evolve_hypothesis_tool(hypothesis: Dict, feedback: str, iteration: int) -> D
             "evolved_hypothesis": {
                 "hypothesis": evolved_text,
                 "iteration": iteration,
-                "improvements": [
-                    "Addressed feasibility concerns",
-                    "Enhanced testability",
-                    "Incorporated feedback"
-                ],
+                "improvements": _EVOLUTION_IMPROVEMENTS,
                 "confidence": min(1.0, hypothesis.get("confidence", 0.5) + 0.1)
             },
             "feedback_incorporated": feedback
@@ -204,15 +261,17 @@ def retrieve_knowledge_tool(query: str, domain: str, limit: int = 10) -> Dict[st
     try:
         # Mock knowledge retrieval - would interface with scientific databases
         knowledge_items = []
+        abstract = _ABSTRACT_TEMPLATE.format(query, domain)
+        journal = _JOURNAL_TEMPLATE.format(domain.title())
         
         for i in range(min(limit, 5)):  # Mock up to 5 items
             knowledge_items.append({
                 "id": f"ref_{i+1}",
-                "title": f"Research Paper {i+1} on {query}",
-                "abstract": f"Abstract discussing {query} in the context of {domain}",
-                "authors": [f"Author {j+1}" for j in range(2)],
+                "title": _TITLE_TEMPLATE.format(i + 1, query),
+                "abstract": abstract,
+                "authors": _MOCK_AUTHORS,
                 "year": 2023 - i,
-                "journal": f"Journal of {domain.title()}",
+                "journal": journal,
                 "relevance_score": max(0.6, 1.0 - (i * 0.1)),
                 "url": f"https://example.com/paper_{i+1}"
             })
@@ -245,31 +304,10 @@ def plan_experiments_tool(hypothesis: str, resources: Dict[str, Any]) -> Dict[st
     """
     try:
         # Mock experimental planning
+        budget = resources.get("budget", 10000)
         experiments = [
-            {
-                "experiment_id": "exp_1",
-                "title": f"Primary validation experiment for hypothesis",
-                "methodology": "Controlled laboratory study",
-                "duration": "4 weeks",
-                "budget_required": resources.get("budget", 10000) * 0.6,
-                "equipment_needed": ["Standard lab equipment", "Specialized instruments"],
-                "expected_outcomes": [
-                    "Validation or refutation of hypothesis",
-                    "Quantitative measurements",
-                    "Statistical significance"
-                ],
-                "success_criteria": "p < 0.05 with effect size > 0.5"
-            },
-            {
-                "experiment_id": "exp_2", 
-                "title": "Follow-up replication study",
-                "methodology": "Independent replication",
-                "duration": "2 weeks",
-                "budget_required": resources.get("budget", 10000) * 0.3,
-                "equipment_needed": ["Basic lab setup"],
-                "expected_outcomes": ["Reproducibility confirmation"],
-                "success_criteria": "Consistent results with primary study"
-            }
+            {**template, "budget_required": budget * share}
+            for template, share in zip(_EXPERIMENT_TEMPLATES, _EXPERIMENT_BUDGET_SHARES)
         ]
         
         return {
@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 
 
 API_KEY = os.getenv("API_KEY")
@@ -25,7 +26,8 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 PRIMARY_MODEL = "llama-3.3-70b-versatile"  # For complex reasoning
 SECONDARY_MODEL = "gemma2-9b-it"  # For faster operations
 
-MODEL_STRENGTHS = {
+# Read-only: shared by every orchestrator instance
+MODEL_STRENGTHS = MappingProxyType({
     "llama-3.3-70b": {
         "model": "Llama 3.3 70B",
         "strengths": "Large parameter model with excellent complex reasoning capabilities, strong logical deduction, high context understanding, and creative problem-solving abilities. Handles multi-step reasoning tasks effectively."
@@ -62,15 +64,29 @@ MODEL_STRENGTHS = {
         "model": "DeepSeek R1",
         "strengths": "Deep reasoning and reflection capabilities, metacognitive analysis, reasoning chain construction, logical verification, and self-reflective problem-solving approaches."
     }
-}
+})
 
-origins = [
-    AI_CO_SCIENTIST_API_BASE,
-    "http://localhost",
-    "http://localhost:8000",
-    "http://localhost:3000",
-] 
+# AI_CO_SCIENTIST_API_BASE is dropped when unset
+origins = tuple(
+    origin
+    for origin in (
+        AI_CO_SCIENTIST_API_BASE,
+        "http://localhost",
+        "http://localhost:8000",
+        "http://localhost:3000",
+    )
+    if origin
+)
 
 MONGODB_URI = os.getenv("MONGODB_URI")
 DATABASE = os.getenv("DATABASE")
 REQUESTS_COLLECTION = os.getenv("REQUESTS_COLLECTION")
+
+# Research sessions older than this many days are expired by MongoDB's TTL
+# monitor; 0 (the default) keeps sessions forever
+try:
+    SESSION_TTL_DAYS = int(os.getenv("SESSION_TTL_DAYS", "0"))
+except ValueError:
+    raise ValueError("SESSION_TTL_DAYS must be a whole number of days")
+if SESSION_TTL_DAYS < 0:
+    raise ValueError("SESSION_TTL_DAYS must be 0 (disabled) or a positive number of days")
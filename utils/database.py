@@ -1,9 +1,23 @@
-from pymongo import MongoClient
-
 from utils.config import MONGODB_URI, DATABASE, REQUESTS_COLLECTION
+from utils.mongo_client import get_mongo_client
+
 
+# Validate once at import so a misconfigured deployment fails here with a
+# clear message instead of on the first write to MongoDB
+_missing = [
+    name
+    for name, value in (
+        ("MONGODB_URI", MONGODB_URI),
+        ("DATABASE", DATABASE),
+        ("REQUESTS_COLLECTION", REQUESTS_COLLECTION),
+    )
+    if not value
+]
+if _missing:
+    raise ValueError(f"MongoDB configuration missing from environment variables: {', '.join(_missing)}")
 
-client = MongoClient(MONGODB_URI)
+# Same process-wide client as EnhancedMemoryService, so there is one pool per URI
+client = get_mongo_client(MONGODB_URI)
 database = client[DATABASE]
 
 requests_collection = database[REQUESTS_COLLECTION]
@@ -1,5 +1,6 @@
-from groq import Groq
+from functools import lru_cache
 from typing import Dict, Any, Optional
+import asyncio
 import logging
 
 from utils.config import GROQ_API_KEY, PRIMARY_MODEL, SECONDARY_MODEL
@@ -13,6 +14,9 @@ class GroqClient:
         if not GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY not found in environment variables")
         
+        # Imported here so the GROQ SDK is only loaded once a client is needed
+        from groq import Groq
+        
         self.client = Groq(api_key=GROQ_API_KEY)
         self.primary_model = PRIMARY_MODEL
         self.secondary_model = SECONDARY_MODEL
@@ -56,6 +60,103 @@ class GroqClient:
             logger.error(f"Error in GROQ chat completion: {e}")
             raise
     
+    async def chat_completion_async(
+        self,
+        messages: list[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        async_client=None,
+        **kwargs
+    ) -> str:
+        """
+        Async variant of chat_completion using an AsyncGroq client
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Model to use (defaults to primary model)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            async_client: AsyncGroq client to reuse; when omitted, one is created
+                and closed for this call on the running event loop
+            **kwargs: Additional arguments for the API
+        
+        Returns:
+            Generated text response
+        """
+        if async_client is None:
+            # AsyncGroq's connection pool is bound to the loop that first uses it, so
+            # it is never stored on this (process-wide) instance
+            from groq import AsyncGroq
+            
+            async with AsyncGroq(api_key=GROQ_API_KEY) as async_client:
+                return await self.chat_completion_async(
+                    messages, model, temperature, max_tokens, async_client=async_client, **kwargs
+                )
+        
+        try:
+            if model is None:
+                model = self.primary_model
+            
+            response = await async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            
+            return response.choices[0].message.content
+            
+        except Exception as e:
+            logger.error(f"Error in GROQ async chat completion: {e}")
+            raise
+    
+    async def chat_completion_batch(
+        self,
+        messages_batch: list[list[Dict[str, str]]],
+        concurrency: int = 8,
+        **kwargs
+    ) -> list[Optional[str]]:
+        """
+        Run several independent chat completions concurrently
+        
+        One AsyncGroq client is created for the batch on the running event loop
+        and closed when it finishes, so this is safe to drive with asyncio.run().
+        A failed request does not cancel the others: its error is logged and its
+        slot in the result is None.
+        
+        Args:
+            messages_batch: One message list per completion
+            concurrency: Maximum number of requests in flight, to stay within rate limits
+            **kwargs: Arguments passed to chat_completion_async for every request
+        
+        Returns:
+            Generated text responses, in the same order as messages_batch (None for failures)
+        """
+        from groq import AsyncGroq
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with AsyncGroq(api_key=GROQ_API_KEY) as async_client:
+            async def complete(messages: list[Dict[str, str]]) -> str:
+                async with semaphore:
+                    return await self.chat_completion_async(messages, async_client=async_client, **kwargs)
+            
+            results = await asyncio.gather(
+                *(complete(messages) for messages in messages_batch),
+                return_exceptions=True
+            )
+        
+        responses = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error(f"GROQ batch completion {index} failed: {result}")
+                responses.append(None)
+            else:
+                responses.append(result)
+        return responses
+    
     def generate_with_system_prompt(
         self,
         system_prompt: str,
@@ -82,5 +183,7 @@ class GroqClient:
         
         return self.chat_completion(messages, model=model, **kwargs)
 
-# Global client instance
-groq_client = GroqClient()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_groq_client() -> GroqClient:
+    """Get the shared GROQ client, creating it on first use"""
+    return GroqClient()
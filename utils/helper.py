@@ -1,10 +1,32 @@
 import requests
-import json
+import orjson
+import re
 import uuid
+import logging
 from datetime import datetime
 from typing import Generator
+from requests.adapters import HTTPAdapter
 from utils.config import GEMMA_SERVICE_URL
 
+logger = logging.getLogger(__name__)
+
+# Shared session so repeated Gemma calls reuse keep-alive connections
+# instead of paying a new TCP/TLS handshake per request
+_gemma_session = requests.Session()
+_gemma_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_gemma_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Patterns like "generated_query": "..." or "query": "...", tried in order
+_QUERY_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r'"generated_query":\s*"([^"]+)"',
+        r'"query":\s*"([^"]+)"',
+        r'query":\s*"([^"]+)"',
+        r'query:\s*"([^"]+)"'
+    )
+)
+
 
 def ask_gemma(prompt: str, streaming: bool = False) -> str | Generator[str, None, None]:
     """
@@ -30,7 +52,7 @@ def ask_gemma(prompt: str, streaming: bool = False) -> str | Generator[str, None
     }
     
     try:
-        response = requests.post(
+        response = _gemma_session.post(
             api_endpoint,
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -45,10 +67,10 @@ def ask_gemma(prompt: str, streaming: bool = False) -> str | Generator[str, None
                 for line in response.iter_lines():
                     if line:
                         try:
-                            chunk = json.loads(line.decode('utf-8'))
+                            chunk = orjson.loads(line)
                             if 'response' in chunk:
                                 yield chunk['response']
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             continue
             
             return stream_generator()
@@ -56,21 +78,21 @@ def ask_gemma(prompt: str, streaming: bool = False) -> str | Generator[str, None
             # For non-streaming, try different response formats
             try:
                 # First, try to parse as a single JSON object
-                return response.json().get('response', '')
-            except json.JSONDecodeError:
+                return orjson.loads(response.content).get('response', '')
+            except orjson.JSONDecodeError:
                 # If that fails, try parsing as streaming format
-                full_response = ""
-                for line in response.text.strip().split('\n'):
+                parts = []
+                for line in response.iter_lines():
                     if line.strip():
                         try:
-                            chunk = json.loads(line)
+                            chunk = orjson.loads(line)
                             if 'response' in chunk:
-                                full_response += chunk['response']
-                        except json.JSONDecodeError:
+                                parts.append(chunk['response'])
+                        except orjson.JSONDecodeError:
                             continue
                 
-                if full_response:
-                    return full_response
+                if parts:
+                    return "".join(parts)
                 else:
                     # If all else fails, return the raw text
                     return response.text.strip()
@@ -98,7 +120,7 @@ def generate_sample_query() -> str:
         response = ask_gemma(prompt, streaming=False)
         
         # Debug: Log the response for troubleshooting
-        print(f"DEBUG: Raw response from Gemma: {repr(response)}")
+        logger.debug("Raw response from Gemma: %r", response)
         
         # Check if response is empty
         if not response or not response.strip():
@@ -133,7 +155,7 @@ def extract_query_from_response(response: str) -> str:
         if cleaned_response.endswith('```'):
             cleaned_response = cleaned_response[:-3]
         
-        query_data = json.loads(cleaned_response.strip())
+        query_data = orjson.loads(cleaned_response.strip())
         
         # If it's a JSON object with generated_query field
         if isinstance(query_data, dict) and 'generated_query' in query_data:
@@ -143,22 +165,12 @@ def extract_query_from_response(response: str) -> str:
         if isinstance(query_data, dict) and 'query' in query_data:
             return query_data['query']
             
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         pass
     
     # If JSON parsing fails, try to extract the query using regex
-    import re
-    
-    # Look for patterns like "generated_query": "..." or "query": "..."
-    patterns = [
-        r'"generated_query":\s*"([^"]+)"',
-        r'"query":\s*"([^"]+)"',
-        r'query":\s*"([^"]+)"',
-        r'query:\s*"([^"]+)"'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, response, re.IGNORECASE | re.DOTALL)
+    for pattern in _QUERY_PATTERNS:
+        match = pattern.search(response)
         if match:
             return match.group(1).strip()
     
@@ -1,12 +1,18 @@
-import json
+import heapq
 import os
+import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import uuid
 import logging
-from pymongo import MongoClient
+import orjson
+from pymongo import IndexModel, InsertOne, UpdateOne, TEXT
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 from bson import ObjectId
 
+from utils.mongo_client import get_mongo_client
+
 class SimpleMemoryService:
     """Simple file-based memory service for session tracking and knowledge storage"""
     
@@ -21,26 +27,35 @@ class SimpleMemoryService:
         # Initialize storage files
         self._initialize_storage()
     
+    def _read_json(self, path: str) -> Any:
+        """Load a JSON storage file"""
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    def _write_json(self, path: str, data: Any):
+        """Rewrite a JSON storage file"""
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    
     def _initialize_storage(self):
         """Initialize storage files if they don't exist"""
         if not os.path.exists(self.sessions_file):
-            with open(self.sessions_file, 'w') as f:
-                json.dump({}, f)
+            self._write_json(self.sessions_file, {})
         
         if not os.path.exists(self.knowledge_file):
-            with open(self.knowledge_file, 'w') as f:
-                json.dump({"hypotheses": [], "concepts": [], "experiments": []}, f)
+            self._write_json(self.knowledge_file, {"hypotheses": [], "concepts": [], "experiments": []})
     
     def create_session(self, query: str, user_id: str = None) -> str:
         """Create a new session and return session ID"""
         session_id = str(uuid.uuid4())
+        now_iso = datetime.now().isoformat()
         
         session_data = {
             "session_id": session_id,
             "user_id": user_id or "anonymous",
             "query": query,
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "last_updated": now_iso,
             "status": "active",
             "hypotheses": [],
             "processing_steps": [],
@@ -48,37 +63,32 @@ class SimpleMemoryService:
         }
         
         # Load existing sessions
-        with open(self.sessions_file, 'r') as f:
-            sessions = json.load(f)
+        sessions = self._read_json(self.sessions_file)
         
         # Add new session
         sessions[session_id] = session_data
         
         # Save sessions
-        with open(self.sessions_file, 'w') as f:
-            json.dump(sessions, f, indent=2)
+        self._write_json(self.sessions_file, sessions)
         
         return session_id
     
     def update_session(self, session_id: str, data: Dict[str, Any]):
         """Update session with new data"""
         # Load existing sessions
-        with open(self.sessions_file, 'r') as f:
-            sessions = json.load(f)
+        sessions = self._read_json(self.sessions_file)
         
         if session_id in sessions:
             sessions[session_id].update(data)
             sessions[session_id]["last_updated"] = datetime.now().isoformat()
             
             # Save sessions
-            with open(self.sessions_file, 'w') as f:
-                json.dump(sessions, f, indent=2)
+            self._write_json(self.sessions_file, sessions)
     
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve session data"""
         try:
-            with open(self.sessions_file, 'r') as f:
-                sessions = json.load(f)
+            sessions = self._read_json(self.sessions_file)
             return sessions.get(session_id)
         except FileNotFoundError:
             return None
@@ -86,8 +96,7 @@ class SimpleMemoryService:
     def store_hypothesis(self, hypothesis_data: Dict[str, Any]):
         """Store hypothesis in knowledge base"""
         try:
-            with open(self.knowledge_file, 'r') as f:
-                knowledge = json.load(f)
+            knowledge = self._read_json(self.knowledge_file)
             
             # Add metadata
             hypothesis_data["stored_at"] = datetime.now().isoformat()
@@ -95,8 +104,7 @@ class SimpleMemoryService:
             
             knowledge["hypotheses"].append(hypothesis_data)
             
-            with open(self.knowledge_file, 'w') as f:
-                json.dump(knowledge, f, indent=2)
+            self._write_json(self.knowledge_file, knowledge)
                 
         except Exception as e:
             print(f"Error storing hypothesis: {e}")
@@ -104,30 +112,30 @@ class SimpleMemoryService:
     def store_concept(self, concept: str, related_data: Dict[str, Any] = None):
         """Store scientific concept in knowledge base"""
         try:
-            with open(self.knowledge_file, 'r') as f:
-                knowledge = json.load(f)
+            knowledge = self._read_json(self.knowledge_file)
+            now_iso = datetime.now().isoformat()
             
             concept_data = {
                 "concept": concept,
-                "stored_at": datetime.now().isoformat(),
+                "stored_at": now_iso,
                 "related_data": related_data or {},
                 "frequency": 1
             }
             
             # Check if concept already exists
+            concept_key = concept.lower()
             existing_concept = next(
-                (c for c in knowledge["concepts"] if c["concept"].lower() == concept.lower()), 
+                (c for c in knowledge["concepts"] if c["concept"].lower() == concept_key), 
                 None
             )
             
             if existing_concept:
                 existing_concept["frequency"] += 1
-                existing_concept["last_seen"] = datetime.now().isoformat()
+                existing_concept["last_seen"] = now_iso
             else:
                 knowledge["concepts"].append(concept_data)
             
-            with open(self.knowledge_file, 'w') as f:
-                json.dump(knowledge, f, indent=2)
+            self._write_json(self.knowledge_file, knowledge)
                 
         except Exception as e:
             print(f"Error storing concept: {e}")
@@ -135,11 +143,11 @@ class SimpleMemoryService:
     def get_related_hypotheses(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Retrieve related hypotheses based on query"""
         try:
-            with open(self.knowledge_file, 'r') as f:
-                knowledge = json.load(f)
+            knowledge = self._read_json(self.knowledge_file)
             
             # Simple keyword matching for related hypotheses
             query_lower = query.lower()
+            query_words = set(query_lower.split())
             related = []
             
             for hypothesis in knowledge["hypotheses"]:
@@ -148,7 +156,6 @@ class SimpleMemoryService:
                 
                 # Simple relevance scoring based on keyword overlap
                 relevance_score = 0
-                query_words = set(query_lower.split())
                 hypothesis_words = set(title.split()) | set(description.split())
                 
                 # Calculate overlap
@@ -158,9 +165,8 @@ class SimpleMemoryService:
                     hypothesis["relevance_score"] = relevance_score
                     related.append(hypothesis)
             
-            # Sort by relevance and return top results
-            related.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
-            return related[:limit]
+            # Return top results by relevance
+            return heapq.nlargest(limit, related, key=lambda x: x.get("relevance_score", 0))
             
         except Exception as e:
             print(f"Error retrieving related hypotheses: {e}")
@@ -169,13 +175,11 @@ class SimpleMemoryService:
     def get_frequent_concepts(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most frequently used concepts"""
         try:
-            with open(self.knowledge_file, 'r') as f:
-                knowledge = json.load(f)
+            knowledge = self._read_json(self.knowledge_file)
             
             concepts = knowledge.get("concepts", [])
-            concepts.sort(key=lambda x: x.get("frequency", 0), reverse=True)
             
-            return concepts[:limit]
+            return heapq.nlargest(limit, concepts, key=lambda x: x.get("frequency", 0))
             
         except Exception as e:
             print(f"Error retrieving frequent concepts: {e}")
@@ -184,21 +188,21 @@ class SimpleMemoryService:
     def cleanup_old_sessions(self, days_old: int = 30):
         """Remove sessions older than specified days"""
         try:
-            with open(self.sessions_file, 'r') as f:
-                sessions = json.load(f)
+            sessions = self._read_json(self.sessions_file)
             
-            cutoff_date = datetime.now() - timedelta(days=days_old)
+            # created_at is always written by datetime.now().isoformat(), so the
+            # ISO strings order the same as the datetimes they encode
+            cutoff = (datetime.now() - timedelta(days=days_old)).isoformat()
             
             # Filter out old sessions
-            active_sessions = {}
-            for session_id, session_data in sessions.items():
-                created_at = datetime.fromisoformat(session_data["created_at"])
-                if created_at > cutoff_date:
-                    active_sessions[session_id] = session_data
+            active_sessions = {
+                session_id: session_data
+                for session_id, session_data in sessions.items()
+                if session_data["created_at"] > cutoff
+            }
             
             # Save cleaned sessions
-            with open(self.sessions_file, 'w') as f:
-                json.dump(active_sessions, f, indent=2)
+            self._write_json(self.sessions_file, active_sessions)
             
             print(f"Cleaned up {len(sessions) - len(active_sessions)} old sessions")
             
@@ -206,98 +210,171 @@ class SimpleMemoryService:
             print(f"Error cleaning up sessions: {e}")
 
 
+# Related-hypothesis lookups skip the lineage list, which grows with every
+# evolution round and is only needed by get_hypothesis_history
+_RELATED_HYPOTHESIS_PROJECTION = {"metadata.parent_hypotheses": 0}
+
 class EnhancedMemoryService:
     """Enhanced memory system for AI Co-Scientist using MongoDB"""
     
+    # (mongo_uri, database_name) pairs whose indexes were already created in this process
+    _indexed_databases = set()
+    
     def __init__(self, mongo_uri: str = None, database_name: str = "ai_coscientist"):
         from utils.config import MONGODB_URI, DATABASE
         
         self.mongo_uri = mongo_uri or MONGODB_URI
         self.database_name = database_name or DATABASE
-        self.client = MongoClient(self.mongo_uri)
+        self.client = get_mongo_client(self.mongo_uri)
         self.db = self.client[self.database_name]
         self.logger = logging.getLogger(__name__)
         self._init_collections()
     
     def _init_collections(self):
         """Initialize MongoDB collections with indexes"""
-        try:
-            # Create indexes for better performance
-            self.db.hypotheses.create_index("id", unique=True)
-            self.db.hypotheses.create_index("created_at")
-            self.db.hypotheses.create_index("research_query")
-            self.db.hypotheses.create_index("domain")
-            
-            self.db.evaluations.create_index("hypothesis_id")
-            self.db.evaluations.create_index("agent_type")
-            self.db.evaluations.create_index("created_at")
-            
-            self.db.evolution_history.create_index("original_hypothesis_id")
-            self.db.evolution_history.create_index("evolved_hypothesis_id")
-            self.db.evolution_history.create_index("evolution_generation")
-            
-            self.db.research_sessions.create_index("session_id", unique=True)
-            self.db.research_sessions.create_index("created_at")
-            self.db.research_sessions.create_index("research_query")
-            self.db.research_sessions.create_index("status")
-            
-            self.db.knowledge_base.create_index("concept")
-            self.db.knowledge_base.create_index("domain")
-            self.db.knowledge_base.create_index("relevance_score")
-            
+        # Index creation is idempotent, so only the first instance per database pays for it
+        index_key = (self.mongo_uri, self.database_name)
+        if index_key in EnhancedMemoryService._indexed_databases:
+            return
+        
+        # Create indexes for better performance, one round-trip per collection.
+        # Each collection is handled on its own so one failure cannot block the rest.
+        succeeded = all([
+            self._create_indexes("hypotheses", [
+                IndexModel("id", unique=True),
+                IndexModel("created_at"),
+                IndexModel("research_query"),
+                IndexModel("domain")
+            ]),
+            self._create_indexes("evaluations", [
+                IndexModel("hypothesis_id"),
+                IndexModel("agent_type"),
+                IndexModel("created_at")
+            ]),
+            self._create_indexes("evolution_history", [
+                IndexModel("original_hypothesis_id"),
+                IndexModel("evolved_hypothesis_id"),
+                IndexModel("evolution_generation")
+            ]),
+            self._create_indexes("research_sessions", [
+                IndexModel("session_id", unique=True),
+                IndexModel("research_query"),
+                IndexModel("status")
+            ]),
+            self._init_session_expiry(),
+            self._create_indexes("knowledge_base", [
+                IndexModel("concept"),
+                IndexModel("domain"),
+                IndexModel("relevance_score")
+            ]),
+            # Full-text index backing get_related_hypotheses
+            self._create_indexes("hypotheses", [
+                IndexModel([
+                    ("title", TEXT),
+                    ("description", TEXT),
+                    ("reasoning", TEXT),
+                    ("research_query", TEXT)
+                ])
+            ])
+        ])
+        
+        # Failures are logged above; retrying per instance would not change the outcome
+        EnhancedMemoryService._indexed_databases.add(index_key)
+        if succeeded:
             self.logger.info("MongoDB collections and indexes initialized successfully")
-            
-        except Exception as e:
-            self.logger.error(f"Error initializing collections: {str(e)}")
+    
+    def _create_indexes(self, collection_name: str, indexes: List[IndexModel]) -> bool:
+        """Create indexes on one collection, logging instead of raising on failure"""
+        try:
+            self.db[collection_name].create_indexes(indexes)
+            return True
+        except PyMongoError as e:
+            self.logger.error(f"Error creating indexes on {collection_name}: {str(e)}")
+            return False
+    
+    def _init_session_expiry(self) -> bool:
+        """Index research_sessions.created_at, as a TTL index when SESSION_TTL_DAYS is set"""
+        from utils.config import SESSION_TTL_DAYS
+        
+        if SESSION_TTL_DAYS <= 0:
+            created_at_index = IndexModel("created_at")
+        else:
+            created_at_index = IndexModel("created_at", expireAfterSeconds=SESSION_TTL_DAYS * 24 * 3600)
+        
+        try:
+            self.db.research_sessions.create_indexes([created_at_index])
+            return True
+        except OperationFailure as e:
+            if e.code != 85:  # IndexOptionsConflict
+                self.logger.error(f"Error creating indexes on research_sessions: {str(e)}")
+                return False
+        except PyMongoError as e:
+            self.logger.error(f"Error creating indexes on research_sessions: {str(e)}")
+            return False
+        
+        if SESSION_TTL_DAYS <= 0:
+            self.logger.warning(
+                "research_sessions.created_at is a TTL index but SESSION_TTL_DAYS is 0; "
+                "leaving it unchanged, drop it manually to stop expiring sessions"
+            )
+            return True
+        
+        # created_at was indexed before the TTL was enabled: convert it in place.
+        # collMod needs MongoDB 5.1+ and dbAdmin, so a failure here only skips expiry.
+        try:
+            self.db.command(
+                "collMod",
+                "research_sessions",
+                index={"keyPattern": {"created_at": 1}, "expireAfterSeconds": SESSION_TTL_DAYS * 24 * 3600}
+            )
+            return True
+        except PyMongoError as e:
+            self.logger.error(f"Could not enable session expiry on research_sessions: {str(e)}")
+            return False
+    
+    def _build_hypothesis_update(self, hypothesis: Dict) -> Tuple[str, Dict]:
+        """Build the hypothesis ID and upsert update document for a hypothesis"""
+        hypothesis_id = hypothesis.get("id", self._generate_id())
+        now = datetime.now()
+        
+        # Create comprehensive hypothesis document; version and created_at
+        # are managed by the upsert
+        hypothesis_doc = {
+            "id": hypothesis_id,
+            "title": hypothesis.get("title", ""),
+            "description": hypothesis.get("description", ""),
+            "reasoning": hypothesis.get("reasoning", ""),
+            "novelty_assessment": hypothesis.get("novelty_assessment", ""),
+            "research_approach": hypothesis.get("research_approach", ""),
+            "domain": hypothesis.get("domain", "general"),
+            "research_query": hypothesis.get("research_query", ""),
+            "updated_at": now,
+            "metadata": {
+                "generation_method": hypothesis.get("generation_method", "unknown"),
+                "confidence_score": hypothesis.get("confidence_score", 0.0),
+                "tags": hypothesis.get("tags", []),
+                "source_session": hypothesis.get("source_session", ""),
+                "parent_hypotheses": hypothesis.get("parent_hypotheses", [])
+            }
+        }
+        
+        # Version starts at 1 via $inc on insert, and created_at is only written the first time
+        update = {
+            "$set": hypothesis_doc,
+            "$inc": {"version": 1},
+            "$setOnInsert": {"created_at": now}
+        }
+        return hypothesis_id, update
     
     def store_hypothesis(self, hypothesis: Dict) -> str:
         """Store hypothesis with versioning and metadata"""
         try:
-            hypothesis_id = hypothesis.get("id", self._generate_id())
-            now = datetime.now()
-            
-            # Create comprehensive hypothesis document
-            hypothesis_doc = {
-                "id": hypothesis_id,
-                "title": hypothesis.get("title", ""),
-                "description": hypothesis.get("description", ""),
-                "reasoning": hypothesis.get("reasoning", ""),
-                "novelty_assessment": hypothesis.get("novelty_assessment", ""),
-                "research_approach": hypothesis.get("research_approach", ""),
-                "domain": hypothesis.get("domain", "general"),
-                "research_query": hypothesis.get("research_query", ""),
-                "created_at": now,
-                "updated_at": now,
-                "version": 1,
-                "metadata": {
-                    "generation_method": hypothesis.get("generation_method", "unknown"),
-                    "confidence_score": hypothesis.get("confidence_score", 0.0),
-                    "tags": hypothesis.get("tags", []),
-                    "source_session": hypothesis.get("source_session", ""),
-                    "parent_hypotheses": hypothesis.get("parent_hypotheses", [])
-                }
-            }
-            
-            # Check if hypothesis already exists
-            existing = self.db.hypotheses.find_one({"id": hypothesis_id})
+            hypothesis_id, update = self._build_hypothesis_update(hypothesis)
             
-            if existing:
-                # Update existing hypothesis (remove version from set operation)
-                hypothesis_doc_update = hypothesis_doc.copy()
-                del hypothesis_doc_update["version"]  # Remove version from $set to avoid conflict
-                
-                result = self.db.hypotheses.update_one(
-                    {"id": hypothesis_id},
-                    {
-                        "$set": hypothesis_doc_update,
-                        "$inc": {"version": 1}
-                    }
-                )
-            else:
-                # Insert new hypothesis
-                result = self.db.hypotheses.insert_one(hypothesis_doc)
+            # Insert or update in one round-trip
+            result = self.db.hypotheses.update_one({"id": hypothesis_id}, update, upsert=True)
             
-            if existing:
+            if result.upserted_id is None:
                 self.logger.info(f"Hypothesis updated: {hypothesis_id}")
             else:
                 self.logger.info(f"New hypothesis stored: {hypothesis_id}")
@@ -308,27 +385,48 @@ class EnhancedMemoryService:
             self.logger.error(f"Error storing hypothesis: {str(e)}")
             return ""
     
+    def bulk_store_hypotheses(self, hypotheses: List[Dict]) -> Tuple[int, List[Tuple[int, str]]]:
+        """
+        Upsert many hypotheses in batched round-trips
+        
+        Args:
+            hypotheses: Hypothesis dictionaries, as accepted by store_hypothesis
+            
+        Returns:
+            Tuple of (number stored, list of (input index, error message) for failures)
+        """
+        operations = []
+        for hypothesis in hypotheses:
+            hypothesis_id, update = self._build_hypothesis_update(hypothesis)
+            operations.append(UpdateOne({"id": hypothesis_id}, update, upsert=True))
+        
+        return self._bulk_write(self.db.hypotheses, operations)
+    
+    def _build_evaluation_doc(self, hypothesis_id: str, evaluation: Dict, agent_type: str) -> Dict:
+        """Build the evaluations collection document for one agent evaluation"""
+        return {
+            "hypothesis_id": hypothesis_id,
+            "agent_type": agent_type,
+            "validity_score": evaluation.get("validity_score", 0.0),
+            "novelty_score": evaluation.get("novelty_score", 0.0),
+            "feasibility_score": evaluation.get("feasibility_score", 0.0),
+            "impact_score": evaluation.get("impact_score", 0.0),
+            "final_score": evaluation.get("final_score", 0.0),
+            "feedback": evaluation.get("feedback", {}),
+            "detailed_analysis": evaluation.get("detailed_analysis", ""),
+            "recommendations": evaluation.get("recommendations", []),
+            "created_at": datetime.now(),
+            "metadata": {
+                "model_used": evaluation.get("model_used", "unknown"),
+                "processing_time": evaluation.get("processing_time", 0.0),
+                "confidence": evaluation.get("confidence", 0.0)
+            }
+        }
+    
     def store_evaluation(self, hypothesis_id: str, evaluation: Dict, agent_type: str):
         """Store agent evaluation results with detailed metrics"""
         try:
-            evaluation_doc = {
-                "hypothesis_id": hypothesis_id,
-                "agent_type": agent_type,
-                "validity_score": evaluation.get("validity_score", 0.0),
-                "novelty_score": evaluation.get("novelty_score", 0.0),
-                "feasibility_score": evaluation.get("feasibility_score", 0.0),
-                "impact_score": evaluation.get("impact_score", 0.0),
-                "final_score": evaluation.get("final_score", 0.0),
-                "feedback": evaluation.get("feedback", {}),
-                "detailed_analysis": evaluation.get("detailed_analysis", ""),
-                "recommendations": evaluation.get("recommendations", []),
-                "created_at": datetime.now(),
-                "metadata": {
-                    "model_used": evaluation.get("model_used", "unknown"),
-                    "processing_time": evaluation.get("processing_time", 0.0),
-                    "confidence": evaluation.get("confidence", 0.0)
-                }
-            }
+            evaluation_doc = self._build_evaluation_doc(hypothesis_id, evaluation, agent_type)
             
             result = self.db.evaluations.insert_one(evaluation_doc)
             self.logger.info(f"Evaluation stored for hypothesis {hypothesis_id} by {agent_type}")
@@ -339,15 +437,51 @@ class EnhancedMemoryService:
             self.logger.error(f"Error storing evaluation: {str(e)}")
             return ""
     
-    def get_hypothesis_history(self, hypothesis_id: str) -> Dict:
-        """Retrieve comprehensive history of a hypothesis"""
+    def store_evaluations(self, evaluations: List[Tuple[str, Dict]], agent_type: str) -> List[str]:
+        """
+        Store a batch of agent evaluations in a single round-trip
+        
+        Args:
+            evaluations: List of (hypothesis_id, evaluation) pairs
+            agent_type: Agent that produced the evaluations
+            
+        Returns:
+            List of inserted document IDs
+        """
+        if not evaluations:
+            return []
+        
+        try:
+            evaluation_docs = [
+                self._build_evaluation_doc(hypothesis_id, evaluation, agent_type)
+                for hypothesis_id, evaluation in evaluations
+            ]
+            
+            result = self.db.evaluations.insert_many(evaluation_docs, ordered=False)
+            self.logger.info(f"{len(result.inserted_ids)} evaluations stored by {agent_type}")
+            
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+            
+        except Exception as e:
+            self.logger.error(f"Error storing evaluations: {str(e)}")
+            return []
+    
+    def get_hypothesis_history(self, hypothesis_id: str, include_evaluations: bool = False) -> Dict:
+        """
+        Retrieve comprehensive history of a hypothesis
+        
+        Args:
+            hypothesis_id: ID of the hypothesis
+            include_evaluations: Also return the full evaluation documents; by
+                default only their aggregated summary is fetched
+            
+        Returns:
+            Dictionary with the hypothesis, its history and an evaluation summary
+        """
         try:
             # Get hypothesis data
             hypothesis_data = self.db.hypotheses.find_one({"id": hypothesis_id})
             
-            # Get all evaluations
-            evaluations = list(self.db.evaluations.find({"hypothesis_id": hypothesis_id}))
-            
             # Get evolution history
             evolution_data = list(self.db.evolution_history.find({
                 "$or": [
@@ -361,49 +495,62 @@ class EnhancedMemoryService:
                 "related_hypotheses": hypothesis_id
             }))
             
-            return {
+            history = {
                 "hypothesis": hypothesis_data,
-                "evaluations": evaluations,
                 "evolution_history": evolution_data,
-                "related_knowledge": related_knowledge,
-                "summary": self._generate_hypothesis_summary(hypothesis_data, evaluations)
+                "related_knowledge": related_knowledge
             }
             
+            if include_evaluations:
+                # The documents are needed anyway, so summarize them in memory
+                evaluations = list(self.db.evaluations.find({"hypothesis_id": hypothesis_id}))
+                history["evaluations"] = evaluations
+                history["summary"] = self._generate_hypothesis_summary(hypothesis_data, evaluations)
+            else:
+                history["summary"] = self._aggregate_hypothesis_summary(hypothesis_id)
+            
+            return history
+            
         except Exception as e:
             self.logger.error(f"Error retrieving hypothesis history: {str(e)}")
             return {}
     
+    def _build_session_doc(self, session) -> Dict:
+        """Build the research_sessions document for a session object or dictionary"""
+        if hasattr(session, '__dict__'):
+            session_data = session.__dict__
+        else:
+            session_data = session
+        
+        now = datetime.now()
+        return {
+            "session_id": session_data.get("session_id", self._generate_session_id()),
+            "research_query": session_data.get("research_query", ""),
+            "status": session_data.get("status", "active"),
+            "created_at": session_data.get("created_at", now),
+            "updated_at": now,
+            "current_round": session_data.get("current_round", 0),
+            "max_rounds": session_data.get("max_rounds", 3),
+            "hypotheses_count": len(session_data.get("hypotheses", [])),
+            "session_data": {
+                "hypotheses": session_data.get("hypotheses", []),
+                "processing_steps": session_data.get("processing_steps", []),
+                "metrics": session_data.get("metrics", {}),
+                "final_results": session_data.get("final_results", {})
+            },
+            "performance_metrics": {
+                "total_processing_time": session_data.get("total_processing_time", 0.0),
+                "agent_performance": session_data.get("agent_performance", {}),
+                "quality_score": session_data.get("quality_score", 0.0)
+            }
+        }
+    
     def store_research_session(self, session):
         """Store comprehensive research session data"""
         try:
-            if hasattr(session, '__dict__'):
-                session_data = session.__dict__
-            else:
-                session_data = session
-            
-            session_doc = {
-                "session_id": session_data.get("session_id", self._generate_session_id()),
-                "research_query": session_data.get("research_query", ""),
-                "status": session_data.get("status", "active"),
-                "created_at": session_data.get("created_at", datetime.now()),
-                "updated_at": datetime.now(),
-                "current_round": session_data.get("current_round", 0),
-                "max_rounds": session_data.get("max_rounds", 3),
-                "hypotheses_count": len(session_data.get("hypotheses", [])),
-                "session_data": {
-                    "hypotheses": session_data.get("hypotheses", []),
-                    "processing_steps": session_data.get("processing_steps", []),
-                    "metrics": session_data.get("metrics", {}),
-                    "final_results": session_data.get("final_results", {})
-                },
-                "performance_metrics": {
-                    "total_processing_time": session_data.get("total_processing_time", 0.0),
-                    "agent_performance": session_data.get("agent_performance", {}),
-                    "quality_score": session_data.get("quality_score", 0.0)
-                }
-            }
+            session_doc = self._build_session_doc(session)
             
-            result = self.db.research_sessions.update_one(
+            self.db.research_sessions.update_one(
                 {"session_id": session_doc["session_id"]},
                 {"$set": session_doc},
                 upsert=True
@@ -416,6 +563,23 @@ class EnhancedMemoryService:
             self.logger.error(f"Error storing research session: {str(e)}")
             return ""
     
+    def bulk_store_research_sessions(self, sessions: List) -> Tuple[int, List[Tuple[int, str]]]:
+        """
+        Upsert many research sessions in batched round-trips
+        
+        Args:
+            sessions: Session objects or dictionaries, as accepted by store_research_session
+            
+        Returns:
+            Tuple of (number stored, list of (input index, error message) for failures)
+        """
+        operations = []
+        for session in sessions:
+            session_doc = self._build_session_doc(session)
+            operations.append(UpdateOne({"session_id": session_doc["session_id"]}, {"$set": session_doc}, upsert=True))
+        
+        return self._bulk_write(self.db.research_sessions, operations)
+    
     def store_evolution_record(self, original_id: str, evolved_id: str, evolution_data: Dict):
         """Store hypothesis evolution tracking"""
         try:
@@ -441,7 +605,14 @@ class EnhancedMemoryService:
             return ""
     
     def get_related_hypotheses(self, query: str, domain: str = None, limit: int = 5) -> List[Dict]:
-        """Advanced hypothesis retrieval with semantic similarity"""
+        """
+        Advanced hypothesis retrieval with semantic similarity
+        
+        Every returned hypothesis carries relevance_score, the 0-1 fraction of
+        query words found in its title, description and reasoning, whichever
+        search path served the query. Results from the text index also carry
+        score, MongoDB's unbounded textScore, which sets their order.
+        """
         try:
             # Build query filter
             filter_query = {}
@@ -449,23 +620,46 @@ class EnhancedMemoryService:
             if domain:
                 filter_query["domain"] = domain
             
-            # Text search on multiple fields
-            text_search = {
+            # Nothing to match on: return the most recent hypotheses via the created_at index
+            if not query or not query.strip():
+                hypotheses = list(
+                    self.db.hypotheses.find(filter_query, _RELATED_HYPOTHESIS_PROJECTION)
+                    .sort("created_at", -1)
+                    .limit(limit)
+                )
+                for hyp in hypotheses:
+                    hyp["relevance_score"] = 0.0
+                return hypotheses
+            
+            # Ranked search through the text index, scored and sorted server-side
+            try:
+                hypotheses = list(
+                    self.db.hypotheses.find(
+                        {**filter_query, "$text": {"$search": query}},
+                        {**_RELATED_HYPOTHESIS_PROJECTION, "score": {"$meta": "textScore"}}
+                    ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+                )
+                for hyp in hypotheses:
+                    hyp["relevance_score"] = self._calculate_relevance_score(query, hyp)
+                return hypotheses
+            except OperationFailure as e:
+                self.logger.warning(f"Text search unavailable, falling back to regex scan: {str(e)}")
+            
+            # Text search on multiple fields; the query is matched literally, and
+            # the one compiled pattern is shared by every field clause
+            query_pattern = re.compile(re.escape(query), re.IGNORECASE)
+            combined_query = {
+                **filter_query,
                 "$or": [
-                    {"title": {"$regex": query, "$options": "i"}},
-                    {"description": {"$regex": query, "$options": "i"}},
-                    {"reasoning": {"$regex": query, "$options": "i"}},
-                    {"research_query": {"$regex": query, "$options": "i"}}
+                    {"title": query_pattern},
+                    {"description": query_pattern},
+                    {"reasoning": query_pattern},
+                    {"research_query": query_pattern}
                 ]
             }
             
-            if filter_query:
-                combined_query = {"$and": [filter_query, text_search]}
-            else:
-                combined_query = text_search
-            
             # Find related hypotheses with scoring
-            hypotheses = list(self.db.hypotheses.find(combined_query).limit(limit))
+            hypotheses = list(self.db.hypotheses.find(combined_query, _RELATED_HYPOTHESIS_PROJECTION).limit(limit))
             
             # Add relevance scoring (simplified)
             for hyp in hypotheses:
@@ -516,20 +710,24 @@ class EnhancedMemoryService:
             self.logger.error(f"Error getting session analytics: {str(e)}")
             return {}
     
+    def _build_knowledge_doc(self, knowledge_item: Dict) -> Dict:
+        """Build the knowledge_base document for a knowledge item"""
+        return {
+            "concept": knowledge_item.get("concept", ""),
+            "domain": knowledge_item.get("domain", "general"),
+            "description": knowledge_item.get("description", ""),
+            "source": knowledge_item.get("source", ""),
+            "relevance_score": knowledge_item.get("relevance_score", 0.0),
+            "related_hypotheses": knowledge_item.get("related_hypotheses", []),
+            "metadata": knowledge_item.get("metadata", {}),
+            "created_at": datetime.now(),
+            "tags": knowledge_item.get("tags", [])
+        }
+    
     def store_knowledge_item(self, knowledge_item: Dict):
         """Store knowledge base items with metadata"""
         try:
-            knowledge_doc = {
-                "concept": knowledge_item.get("concept", ""),
-                "domain": knowledge_item.get("domain", "general"),
-                "description": knowledge_item.get("description", ""),
-                "source": knowledge_item.get("source", ""),
-                "relevance_score": knowledge_item.get("relevance_score", 0.0),
-                "related_hypotheses": knowledge_item.get("related_hypotheses", []),
-                "metadata": knowledge_item.get("metadata", {}),
-                "created_at": datetime.now(),
-                "tags": knowledge_item.get("tags", [])
-            }
+            knowledge_doc = self._build_knowledge_doc(knowledge_item)
             
             result = self.db.knowledge_base.insert_one(knowledge_doc)
             self.logger.info(f"Knowledge item stored: {knowledge_item.get('concept', 'Unknown')}")
@@ -540,6 +738,45 @@ class EnhancedMemoryService:
             self.logger.error(f"Error storing knowledge item: {str(e)}")
             return ""
     
+    def bulk_store_knowledge_items(self, knowledge_items: List[Dict]) -> Tuple[int, List[Tuple[int, str]]]:
+        """
+        Insert many knowledge base items in batched round-trips
+        
+        Args:
+            knowledge_items: Knowledge item dictionaries, as accepted by store_knowledge_item
+            
+        Returns:
+            Tuple of (number stored, list of (input index, error message) for failures)
+        """
+        operations = [InsertOne(self._build_knowledge_doc(item)) for item in knowledge_items]
+        return self._bulk_write(self.db.knowledge_base, operations)
+    
+    def _bulk_write(self, collection, operations: List, batch_size: int = 1000) -> Tuple[int, List[Tuple[int, str]]]:
+        """Apply write operations as unordered bulk writes of at most batch_size each"""
+        applied = 0
+        failures = []
+        
+        for start in range(0, len(operations), batch_size):
+            batch = operations[start:start + batch_size]
+            try:
+                collection.bulk_write(batch, ordered=False)
+                applied += len(batch)
+            except BulkWriteError as bwe:
+                # Unordered writes carry on past failures; report each failed operation by input index
+                write_errors = bwe.details.get("writeErrors", [])
+                applied += len(batch) - len(write_errors)
+                failures.extend(
+                    (start + error["index"], error.get("errmsg", "unknown error"))
+                    for error in write_errors
+                )
+            except PyMongoError as e:
+                # The batch outcome is unknown (e.g. connection lost), so report all of
+                # it as failed and carry on with the next batch
+                self.logger.error(f"Bulk write batch at index {start} failed: {str(e)}")
+                failures.extend((start + offset, str(e)) for offset in range(len(batch)))
+        
+        return applied, failures
+    
     def _generate_id(self) -> str:
         """Generate unique ID for hypothesis"""
         return f"hyp_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
@@ -589,15 +826,70 @@ class EnhancedMemoryService:
             "last_evaluation": max(e.get("created_at", datetime.min) for e in evaluations)
         }
     
+    def _aggregate_hypothesis_summary(self, hypothesis_id: str) -> Dict:
+        """Generate the same summary as _generate_hypothesis_summary with a server-side $group"""
+        # Missing fields count as 0 / "" like the in-memory summary, rather than
+        # being skipped as $avg and $addToSet would do on their own
+        pipeline = [
+            {"$match": {"hypothesis_id": hypothesis_id}},
+            {"$group": {
+                "_id": None,
+                "validity": {"$avg": {"$ifNull": ["$validity_score", 0]}},
+                "novelty": {"$avg": {"$ifNull": ["$novelty_score", 0]}},
+                "feasibility": {"$avg": {"$ifNull": ["$feasibility_score", 0]}},
+                "impact": {"$avg": {"$ifNull": ["$impact_score", 0]}},
+                "overall": {"$avg": {"$ifNull": ["$final_score", 0]}},
+                "evaluation_count": {"$sum": 1},
+                "agents_evaluated": {"$addToSet": {"$ifNull": ["$agent_type", ""]}},
+                "last_evaluation": {"$max": "$created_at"}
+            }}
+        ]
+        
+        result = list(self.db.evaluations.aggregate(pipeline))
+        
+        if not result:
+            return {"status": "no_evaluations"}
+        
+        summary = result[0]
+        return {
+            "average_scores": {
+                "validity": summary["validity"],
+                "novelty": summary["novelty"],
+                "feasibility": summary["feasibility"],
+                "impact": summary["impact"],
+                "overall": summary["overall"]
+            },
+            "evaluation_count": summary["evaluation_count"],
+            "agents_evaluated": summary["agents_evaluated"],
+            "last_evaluation": summary["last_evaluation"] or datetime.min
+        }
+    
     def close(self):
-        """Close MongoDB connection"""
-        try:
-            self.client.close()
-            self.logger.info("MongoDB connection closed")
-        except Exception as e:
-            self.logger.error(f"Error closing MongoDB connection: {str(e)}")
+        """
+        Release this service's MongoDB connection.
+        
+        The client is shared process-wide (see utils.mongo_client) and closed
+        at interpreter exit, so this is a no-op kept for existing callers.
+        """
+        self.logger.info("MongoDB client is shared; it is closed at interpreter exit")
+
+
+# Global memory service instances, created on first use so importing this
+# module does not touch the filesystem or open a MongoDB connection
+@lru_cache(maxsize=None)
+def get_memory_service() -> SimpleMemoryService:
+    """Get the shared file-based memory service"""
+    return SimpleMemoryService()
 
+@lru_cache(maxsize=None)
+def get_enhanced_memory_service() -> EnhancedMemoryService:
+    """Get the shared MongoDB-backed memory service"""
+    return EnhancedMemoryService()
 
-# Global memory service instances
-memory_service = SimpleMemoryService()
-enhanced_memory_service = EnhancedMemoryService()
\ No newline at end of file
+def __getattr__(name: str):
+    # Keep the old module attributes working for existing imports
+    if name == "memory_service":
+        return get_memory_service()
+    if name == "enhanced_memory_service":
+        return get_enhanced_memory_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,11 +3,11 @@ Data Migration Script for AI Co-Scientist Memory System
 Migrates data from file-based SimpleMemoryService to MongoDB-based EnhancedMemoryService
 """
 
-import json
 import os
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+import orjson
 from utils.memory_service import SimpleMemoryService, EnhancedMemoryService
 
 logging.basicConfig(level=logging.INFO)
@@ -77,28 +77,29 @@ class MemoryMigrationService:
                 logger.warning(f"Sessions file not found: {sessions_file}")
                 return result
             
-            with open(sessions_file, 'r') as f:
-                sessions_data = json.load(f)
+            with open(sessions_file, 'rb') as f:
+                sessions_data = orjson.loads(f.read())
             
+            session_ids = []
+            enhanced_sessions = []
             for session_id, session_data in sessions_data.items():
                 try:
                     # Transform session data for enhanced memory service
-                    enhanced_session = self._transform_session_data(session_data)
-                    
-                    # Store in MongoDB
-                    stored_id = self.enhanced_memory.store_research_session(enhanced_session)
-                    
-                    if stored_id:
-                        result["sessions_migrated"] += 1
-                        logger.info(f"Migrated session: {session_id}")
-                    else:
-                        result["session_errors"].append(f"Failed to store session: {session_id}")
-                        
+                    enhanced_sessions.append(self._transform_session_data(session_data))
+                    session_ids.append(session_id)
                 except Exception as e:
                     error_msg = f"Error migrating session {session_id}: {str(e)}"
                     result["session_errors"].append(error_msg)
                     logger.error(error_msg)
             
+            # Store in MongoDB in batched round-trips
+            stored_count, failures = self.enhanced_memory.bulk_store_research_sessions(enhanced_sessions)
+            result["sessions_migrated"] = stored_count
+            for index, error in failures:
+                error_msg = f"Failed to store session {session_ids[index]}: {error}"
+                result["session_errors"].append(error_msg)
+                logger.error(error_msg)
+            
             logger.info(f"Session migration completed: {result['sessions_migrated']} sessions migrated")
             
         except Exception as e:
@@ -126,51 +127,53 @@ class MemoryMigrationService:
                 logger.warning(f"Knowledge base file not found: {knowledge_file}")
                 return result
             
-            with open(knowledge_file, 'r') as f:
-                knowledge_data = json.load(f)
+            with open(knowledge_file, 'rb') as f:
+                knowledge_data = orjson.loads(f.read())
             
             # Migrate hypotheses
             hypotheses = knowledge_data.get("hypotheses", [])
+            hypothesis_ids = []
+            enhanced_hypotheses = []
             for hypothesis in hypotheses:
                 try:
                     # Transform hypothesis data
-                    enhanced_hypothesis = self._transform_hypothesis_data(hypothesis)
-                    
-                    # Store in MongoDB
-                    stored_id = self.enhanced_memory.store_hypothesis(enhanced_hypothesis)
-                    
-                    if stored_id:
-                        result["hypotheses_migrated"] += 1
-                        logger.info(f"Migrated hypothesis: {hypothesis.get('id', 'unknown')}")
-                    else:
-                        result["hypothesis_errors"].append(f"Failed to store hypothesis: {hypothesis.get('id', 'unknown')}")
-                        
+                    enhanced_hypotheses.append(self._transform_hypothesis_data(hypothesis))
+                    hypothesis_ids.append(hypothesis.get('id', 'unknown'))
                 except Exception as e:
                     error_msg = f"Error migrating hypothesis {hypothesis.get('id', 'unknown')}: {str(e)}"
                     result["hypothesis_errors"].append(error_msg)
                     logger.error(error_msg)
             
+            # Store in MongoDB in batched round-trips
+            stored_count, failures = self.enhanced_memory.bulk_store_hypotheses(enhanced_hypotheses)
+            result["hypotheses_migrated"] = stored_count
+            for index, error in failures:
+                error_msg = f"Failed to store hypothesis {hypothesis_ids[index]}: {error}"
+                result["hypothesis_errors"].append(error_msg)
+                logger.error(error_msg)
+            
             # Migrate concepts to knowledge base
             concepts = knowledge_data.get("concepts", [])
+            concept_names = []
+            enhanced_concepts = []
             for concept in concepts:
                 try:
                     # Transform concept data
-                    enhanced_concept = self._transform_concept_data(concept)
-                    
-                    # Store in MongoDB knowledge base
-                    stored_id = self.enhanced_memory.store_knowledge_item(enhanced_concept)
-                    
-                    if stored_id:
-                        result["concepts_migrated"] += 1
-                        logger.info(f"Migrated concept: {concept.get('concept', 'unknown')}")
-                    else:
-                        result["concept_errors"].append(f"Failed to store concept: {concept.get('concept', 'unknown')}")
-                        
+                    enhanced_concepts.append(self._transform_concept_data(concept))
+                    concept_names.append(concept.get('concept', 'unknown'))
                 except Exception as e:
                     error_msg = f"Error migrating concept {concept.get('concept', 'unknown')}: {str(e)}"
                     result["concept_errors"].append(error_msg)
                     logger.error(error_msg)
             
+            # Store in MongoDB knowledge base in batched round-trips
+            stored_count, failures = self.enhanced_memory.bulk_store_knowledge_items(enhanced_concepts)
+            result["concepts_migrated"] = stored_count
+            for index, error in failures:
+                error_msg = f"Failed to store concept {concept_names[index]}: {error}"
+                result["concept_errors"].append(error_msg)
+                logger.error(error_msg)
+            
             logger.info(f"Knowledge base migration completed: {result['hypotheses_migrated']} hypotheses, {result['concepts_migrated']} concepts migrated")
             
         except Exception as e:
@@ -293,13 +296,13 @@ class MemoryMigrationService:
             file_concepts = 0
             
             if os.path.exists(sessions_file):
-                with open(sessions_file, 'r') as f:
-                    sessions_data = json.load(f)
+                with open(sessions_file, 'rb') as f:
+                    sessions_data = orjson.loads(f.read())
                     file_sessions = len(sessions_data)
             
             if os.path.exists(knowledge_file):
-                with open(knowledge_file, 'r') as f:
-                    knowledge_data = json.load(f)
+                with open(knowledge_file, 'rb') as f:
+                    knowledge_data = orjson.loads(f.read())
                     file_hypotheses = len(knowledge_data.get("hypotheses", []))
                     file_concepts = len(knowledge_data.get("concepts", []))
             
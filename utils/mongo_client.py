@@ -0,0 +1,52 @@
+import atexit
+import logging
+from typing import Dict
+
+from pymongo import MongoClient
+
+logger = logging.getLogger(__name__)
+
+# One MongoClient (and so one connection pool and monitor thread set) per URI,
+# shared by every consumer in the process and closed once at interpreter exit
+_mongo_clients: Dict[str, MongoClient] = {}
+
+
+def get_mongo_client(mongo_uri: str) -> MongoClient:
+    """
+    Get the shared MongoClient for a URI, creating it on first use
+
+    Explicit pool sizing and short selection/wait timeouts so bursts of writes
+    reuse warm connections and surface an unreachable server in seconds rather
+    than after the 30s driver default.
+
+    Args:
+        mongo_uri: MongoDB connection string
+
+    Returns:
+        The process-wide MongoClient for that URI
+    """
+    client = _mongo_clients.get(mongo_uri)
+    if client is None:
+        client = MongoClient(
+            mongo_uri,
+            maxPoolSize=50,
+            minPoolSize=5,
+            maxIdleTimeMS=60_000,
+            waitQueueTimeoutMS=5_000,
+            serverSelectionTimeoutMS=3_000,
+            connectTimeoutMS=3_000,
+            retryWrites=True,
+        )
+        _mongo_clients[mongo_uri] = client
+    return client
+
+
+@atexit.register
+def _close_mongo_clients():
+    """Close every shared client once, at interpreter exit"""
+    while _mongo_clients:
+        _, client = _mongo_clients.popitem()
+        try:
+            client.close()
+        except Exception as e:
+            logger.error(f"Error closing MongoDB connection: {str(e)}")
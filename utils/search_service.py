@@ -1,10 +1,11 @@
-import os
 import logging
 from typing import List, Dict, Optional
 from tavily import TavilyClient
 from dataclasses import dataclass
 
-@dataclass
+from utils.config import TAVILY_API_KEY
+
+@dataclass(slots=True)
 class SearchResult:
     title: str
     content: str
@@ -15,7 +16,7 @@ class TavilySearchService:
     """Scientific literature and web search service using Tavily API"""
     
     def __init__(self):
-        self.api_key = os.getenv("TAVILY_API_KEY")
+        self.api_key = TAVILY_API_KEY
         if not self.api_key:
             raise ValueError("TAVILY_API_KEY environment variable not set")
         self.client = TavilyClient(self.api_key)